@@ -55,7 +55,7 @@ class InputSpec:
     input_name: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParseResult:
     """Result of parsing a .pym file."""
 
@@ -66,7 +66,7 @@ class ParseResult:
     file: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceMap:
     """Maps line numbers between .pym and monty_code.py."""
 
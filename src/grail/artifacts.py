@@ -2,6 +2,8 @@
 
 import json
 import logging
+import os
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -12,6 +14,22 @@ logger = logging.getLogger(__name__)
 ARTIFACTS_DIR_NAME = ".grail"
 
 
+def _write_text_atomic(path: Path, content: str) -> None:
+    """
+    Write a file via a temp file and rename.
+
+    Readers and concurrent writers (parallel test workers, several
+    processes loading the same script) never see a partially written file.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_text(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 class ArtifactsManager:
     """Manages .grail/ directory and generated artifacts."""
 
@@ -52,11 +70,12 @@ class ArtifactsManager:
         script_dir.mkdir(parents=True, exist_ok=True)
 
         # Write stubs.pyi
-        (script_dir / "stubs.pyi").write_text(stubs)
+        _write_text_atomic(script_dir / "stubs.pyi", stubs)
 
         # Write monty_code.py
-        (script_dir / "monty_code.py").write_text(
-            "# Auto-generated by grail — this is what Monty actually executes\n\n" + monty_code
+        _write_text_atomic(
+            script_dir / "monty_code.py",
+            "# Auto-generated by grail — this is what Monty actually executes\n\n" + monty_code,
         )
 
         # Write check.json
@@ -79,7 +98,7 @@ class ArtifactsManager:
             ],
             "info": check_result.info,
         }
-        (script_dir / "check.json").write_text(json.dumps(check_data, indent=2))
+        _write_text_atomic(script_dir / "check.json", json.dumps(check_data, indent=2))
 
         # Write externals.json
         externals_data = {
@@ -97,7 +116,7 @@ class ArtifactsManager:
                 for ext in externals.values()
             ]
         }
-        (script_dir / "externals.json").write_text(json.dumps(externals_data, indent=2))
+        _write_text_atomic(script_dir / "externals.json", json.dumps(externals_data, indent=2))
 
         # Write inputs.json
         inputs_data = {
@@ -111,7 +130,7 @@ class ArtifactsManager:
                 for inp in inputs.values()
             ]
         }
-        (script_dir / "inputs.json").write_text(json.dumps(inputs_data, indent=2))
+        _write_text_atomic(script_dir / "inputs.json", json.dumps(inputs_data, indent=2))
 
     def write_run_log(
         self, script_name: str, stdout: str, stderr: str, duration_ms: float, success: bool
@@ -143,7 +162,7 @@ class ArtifactsManager:
             log_lines.append("[stderr]")
             log_lines.append(stderr)
 
-        (script_dir / "run.log").write_text("\n".join(log_lines))
+        _write_text_atomic(script_dir / "run.log", "\n".join(log_lines))
 
     def clean(self) -> None:
         """Remove the entire .grail/ directory."""
@@ -36,6 +36,7 @@ class MontyCompatibilityChecker(ast.NodeVisitor):
         self.warnings: list[CheckMessage] = []
         self.source_lines = source_lines
         self.features_used: set[str] = set()
+        self.referenced_names: set[str] = set()
 
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """Detect class definitions (not supported in Monty)."""
@@ -195,6 +196,18 @@ class MontyCompatibilityChecker(ast.NodeVisitor):
         self.features_used.add("f_string")
         self.generic_visit(node)
 
+    def visit_Name(self, node: ast.Name) -> None:
+        """Record loaded names for the unused-declaration warnings."""
+        if isinstance(node.ctx, ast.Load):
+            self.referenced_names.add(node.id)
+        self.generic_visit(node)
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        """Record loaded attribute names for the unused-declaration warnings."""
+        if isinstance(node.ctx, ast.Load):
+            self.referenced_names.add(node.attr)
+        self.generic_visit(node)
+
     def visit_Global(self, node: ast.Global) -> None:
         """Detect global statements (not supported in Monty)."""
         self.errors.append(
@@ -308,6 +321,10 @@ def check_declarations(parse_result: ParseResult) -> list[CheckMessage]:
     for node in parse_result.ast_module.body:
         if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
             continue
+        # The parser already indexed externals by name; skip the decorator
+        # scan for functions that can't be one.
+        if node.name not in parse_result.externals:
+            continue
         has_external = any(
             (isinstance(d, ast.Name) and d.id == "external")
             or (isinstance(d, ast.Attribute) and d.attr == "external")
@@ -364,7 +381,9 @@ def check_declarations(parse_result: ParseResult) -> list[CheckMessage]:
     return errors
 
 
-def check_for_warnings(parse_result: ParseResult) -> list[CheckMessage]:
+def check_for_warnings(
+    parse_result: ParseResult, referenced_names: set[str] | None = None
+) -> list[CheckMessage]:
     """Check for warning conditions (non-blocking issues).
 
     Warnings:
@@ -375,6 +394,9 @@ def check_for_warnings(parse_result: ParseResult) -> list[CheckMessage]:
 
     Args:
         parse_result: Result of parsing a .pym file.
+        referenced_names: Names already collected by MontyCompatibilityChecker.
+            If None, a full MontyCompatibilityChecker pass collects them and
+            its compatibility errors are discarded.
 
     Returns:
         List of warning messages.
@@ -418,15 +440,10 @@ def check_for_warnings(parse_result: ParseResult) -> list[CheckMessage]:
         )
 
     # W002: Unused @external functions
-    external_names = set(parse_result.externals.keys())
-    input_names = set(parse_result.inputs.keys())
-
-    referenced_names: set[str] = set()
-    for node in ast.walk(module):
-        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
-            referenced_names.add(node.id)
-        elif isinstance(node, ast.Attribute) and isinstance(node.ctx, ast.Load):
-            referenced_names.add(node.attr)
+    if referenced_names is None:
+        checker = MontyCompatibilityChecker(parse_result.source_lines)
+        checker.visit(module)
+        referenced_names = checker.referenced_names
 
     for name, spec in parse_result.externals.items():
         if name not in referenced_names:
@@ -480,7 +497,7 @@ def check_pym(parse_result: ParseResult) -> CheckResult:
     declaration_errors = check_declarations(parse_result)
     all_errors = checker.errors + declaration_errors
 
-    warnings = check_for_warnings(parse_result)
+    warnings = check_for_warnings(parse_result, checker.referenced_names)
     warnings.extend(checker.warnings)
 
     info = {
@@ -5,9 +5,7 @@ import functools
 import logging
 import sys
 import json
-import inspect
 from pathlib import Path
-from typing import List
 
 import grail
 from grail.script import load
@@ -198,13 +196,13 @@ def cmd_run(args):
     # Parse inputs
     inputs = {}
     for item in args.input:
-        if "=" not in item:
+        key, sep, value = item.partition("=")
+        if not sep:
             print(
                 f"Error: Invalid input format '{item}'. Use key=value.",
                 file=sys.stderr,
             )
             return 1
-        key, value = item.split("=", 1)
         inputs[key.strip()] = value.strip()
 
     # Load host file if provided
@@ -304,8 +302,8 @@ def cmd_clean(args):
     return 0
 
 
-def main():
-    """Main CLI entry point."""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the grail argument parser with all subcommands."""
     from grail import __version__
 
     parser = argparse.ArgumentParser(
@@ -361,6 +359,13 @@ def main():
     parser_clean = subparsers.add_parser("clean", help="Remove .grail/ directory")
     parser_clean.set_defaults(func=cmd_clean)
 
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    parser = build_parser()
+
     # Parse and execute
     args = parser.parse_args()
 
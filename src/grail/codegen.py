@@ -76,7 +76,11 @@ class GrailDeclarationStripper(ast.NodeTransformer):
         return self.generic_visit(node)
 
 
-def build_source_map(transformed_ast: ast.Module, generated_code: str) -> SourceMap:
+def build_source_map(
+    transformed_ast: ast.Module,
+    generated_code: str,
+    generated_ast: ast.Module | None = None,
+) -> SourceMap:
     """
     Build line number mapping between .pym and generated code.
 
@@ -88,12 +92,14 @@ def build_source_map(transformed_ast: ast.Module, generated_code: str) -> Source
     Args:
         transformed_ast: AST after stripping declarations (retains original line numbers)
         generated_code: Generated Monty code string
+        generated_ast: Already-parsed ``generated_code``, if the caller has one
 
     Returns:
         SourceMap with line mappings
     """
     source_map = SourceMap()
-    generated_ast = ast.parse(generated_code)
+    if generated_ast is None:
+        generated_ast = ast.parse(generated_code)
 
     def _collect_line_numbers(module: ast.Module) -> list[int]:
         """Collect line numbers for all statement-level nodes."""
@@ -146,7 +152,7 @@ def generate_monty_code(parse_result: ParseResult) -> tuple[str, SourceMap]:
 
     # Validate generated code is syntactically valid
     try:
-        ast.parse(monty_code)
+        generated_ast = ast.parse(monty_code)
     except SyntaxError as exc:
         raise GrailError(
             f"Code generation produced invalid Python: {exc}. "
@@ -154,6 +160,6 @@ def generate_monty_code(parse_result: ParseResult) -> tuple[str, SourceMap]:
         )
 
     # Build source map
-    source_map = build_source_map(transformed, monty_code)
+    source_map = build_source_map(transformed, monty_code, generated_ast)
 
     return monty_code, source_map
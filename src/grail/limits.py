@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from typing import Any
 
@@ -51,6 +52,16 @@ def parse_duration_string(value: str) -> float:
     return number / 1000.0 if unit == "ms" else number
 
 
+# Limits field name -> pydantic_monty limits key.
+_MONTY_KEY_MAP: tuple[tuple[str, str], ...] = (
+    ("max_memory", "max_memory"),
+    ("max_duration", "max_duration_secs"),
+    ("max_recursion", "max_recursion_depth"),
+    ("max_allocations", "max_allocations"),
+    ("gc_interval", "gc_interval"),
+)
+
+
 class Limits(BaseModel, frozen=True):
     """
     Resource limits for script execution.
@@ -103,8 +114,10 @@ class Limits(BaseModel, frozen=True):
         return v
 
     # --- Presets ---
+    # Limits is frozen, so each preset is built once and shared.
 
     @classmethod
+    @functools.cache
     def strict(cls) -> Limits:
         """Tight limits for untrusted code."""
         return cls(
@@ -114,6 +127,7 @@ class Limits(BaseModel, frozen=True):
         )
 
     @classmethod
+    @functools.cache
     def default(cls) -> Limits:
         """Balanced defaults for typical scripts."""
         return cls(
@@ -123,6 +137,7 @@ class Limits(BaseModel, frozen=True):
         )
 
     @classmethod
+    @functools.cache
     def permissive(cls) -> Limits:
         """Relaxed limits for trusted or heavy workloads."""
         return cls(
@@ -139,23 +154,8 @@ class Limits(BaseModel, frozen=True):
 
         Only non-None fields in `overrides` replace the base values.
         """
-        return Limits(
-            max_memory=overrides.max_memory
-            if overrides.max_memory is not None
-            else self.max_memory,
-            max_duration=overrides.max_duration
-            if overrides.max_duration is not None
-            else self.max_duration,
-            max_recursion=overrides.max_recursion
-            if overrides.max_recursion is not None
-            else self.max_recursion,
-            max_allocations=overrides.max_allocations
-            if overrides.max_allocations is not None
-            else self.max_allocations,
-            gc_interval=overrides.gc_interval
-            if overrides.gc_interval is not None
-            else self.gc_interval,
-        )
+        # Both sides are already validated, so copy instead of re-running validators.
+        return self.model_copy(update=overrides.model_dump(exclude_none=True))
 
     # --- Monty Conversion ---
 
@@ -167,15 +167,8 @@ class Limits(BaseModel, frozen=True):
             max_duration  -> max_duration_secs
             max_recursion -> max_recursion_depth
         """
-        mapping: list[tuple[str, str]] = [
-            ("max_memory", "max_memory"),
-            ("max_duration", "max_duration_secs"),
-            ("max_recursion", "max_recursion_depth"),
-            ("max_allocations", "max_allocations"),
-            ("gc_interval", "gc_interval"),
-        ]
         result: dict[str, Any] = {}
-        for attr, monty_key in mapping:
+        for attr, monty_key in _MONTY_KEY_MAP:
             value = getattr(self, attr)
             if value is not None:
                 result[monty_key] = value
@@ -7,7 +7,7 @@ import logging
 from pathlib import Path
 from typing import Any
 
-from grail._types import ExternalSpec, InputSpec, ParameterSpec, ParseResult
+from grail._types import ExternalSpec, InputSpec, ParameterSpec, ParamKind, ParseResult
 from grail.errors import ParseError
 
 logger = logging.getLogger(__name__)
@@ -55,8 +55,6 @@ def extract_function_params(
     Returns:
         List of parameter specifications.
     """
-    from grail._types import ParamKind
-
     params: list[ParameterSpec] = []
     args = func_node.args
 
@@ -1,6 +1,7 @@
 """GrailScript - Main API for loading and executing .pym files."""
 
 import asyncio
+import dataclasses
 import functools
 import logging
 import warnings
@@ -41,6 +42,17 @@ from grail.errors import (
 from pydantic import BaseModel
 
 
+@functools.lru_cache(maxsize=128)
+def _monty_limits(limits: Limits) -> dict[str, Any]:
+    """
+    Convert Limits to Monty's dict format once per distinct value.
+
+    Limits is frozen and hashable, so equal limits share one dict across
+    runs. The returned dict is shared and must be treated as read-only.
+    """
+    return limits.to_monty()
+
+
 class GrailScript:
     """
     Main interface for loading and executing .pym files.
@@ -97,7 +109,11 @@ class GrailScript:
         self.environ = environ
         self.grail_dir = grail_dir
         self.dataclass_registry = dataclass_registry
+        self._input_names = list(inputs)
+        self._external_names = list(externals)
         self._parse_result: ParseResult | None = None  # Set by load() for check() reuse
+        self._check_result: CheckResult | None = None  # Set by load() for check() reuse
+        self._monty: pydantic_monty.Monty | None = None  # Type-checked program, built on first run
 
         # Initialize artifacts manager if grail_dir is set
         self._artifacts = ArtifactsManager(grail_dir) if grail_dir else None
@@ -123,14 +139,24 @@ class GrailScript:
                 )
             )
 
-        # Use cached parse result for consistency with load-time
-        # This avoids TOCTOU issues if file changed on disk
-        parse_result = self._parse_result
-        if parse_result is None:
-            parse_result = parse_pym_file(self.path)
+        if self._check_result is not None:
+            # Reuse the load-time checks; copy the lists so appending below
+            # never leaks into the cached result
+            check_result = dataclasses.replace(
+                self._check_result,
+                errors=list(self._check_result.errors),
+                warnings=list(self._check_result.warnings),
+                info=dict(self._check_result.info),
+            )
+        else:
+            # Use cached parse result for consistency with load-time
+            # This avoids TOCTOU issues if file changed on disk
+            parse_result = self._parse_result
+            if parse_result is None:
+                parse_result = parse_pym_file(self.path)
 
-        check_result = check_pym(parse_result)
-        check_result.file = str(self.path)
+            check_result = check_pym(parse_result)
+            check_result.file = str(self.path)
 
         # Run Monty type checker
         try:
@@ -139,8 +165,8 @@ class GrailScript:
                 script_name=f"{self.name}.pym",
                 type_check=True,
                 type_check_stubs=self.stubs,
-                inputs=list(self.inputs.keys()),
-                external_functions=list(self.externals.keys()),
+                inputs=self._input_names,
+                external_functions=self._external_names,
             )
         except pydantic_monty.MontyTypingError as e:
             check_result.errors.append(
@@ -257,11 +283,11 @@ class GrailScript:
         base = self.limits
         if base is None:
             if override_limits is None:
-                return Limits.default().to_monty()
-            return override_limits.to_monty()
+                return _monty_limits(Limits.default())
+            return _monty_limits(override_limits)
         if override_limits is None:
-            return base.to_monty()
-        return base.merge(override_limits).to_monty()
+            return _monty_limits(base)
+        return _monty_limits(base.merge(override_limits))
 
     def _prepare_monty_os_access(
         self,
@@ -457,10 +483,14 @@ class GrailScript:
         externals = externals or {}
         monty_inputs = inputs if self.inputs else None
 
+        # Print output is only kept for the run log, so skip buffering it
+        # when artifacts are disabled.
         captured_output: list[str] = []
+        capture_output = self._artifacts is not None
 
         def _monty_print_callback(stream: str, text: str) -> None:
-            captured_output.append(text)
+            if capture_output:
+                captured_output.append(text)
             if print_callback is not None:
                 print_callback(stream, text)
             if on_event is not None:
@@ -496,25 +526,30 @@ class GrailScript:
         parsed_limits = self._prepare_monty_limits(limits)
         os_access = self._prepare_monty_os_access(files, environ)
 
-        # Create Monty instance - catch type errors during construction
-        try:
-            monty = pydantic_monty.Monty(
-                self.monty_code,
-                script_name=f"{self.name}.pym",
-                type_check=True,
-                type_check_stubs=self.stubs,
-                inputs=list(self.inputs.keys()),
-                external_functions=list(self.externals.keys()),
-                dataclass_registry=self.dataclass_registry,
-            )
-        except pydantic_monty.MontyTypingError as e:
-            # Convert type errors to ExecutionError
-            raise ExecutionError(
-                f"Type checking failed: {str(e)}",
-                lineno=None,
-                source_context=None,
-                suggestion="Fix type errors in your code",
-            ) from e
+        # Create Monty instance - catch type errors during construction.
+        # Monty parses and type checks once and can be run repeatedly, so the
+        # instance is reused across run() calls.
+        monty = self._monty
+        if monty is None:
+            try:
+                monty = pydantic_monty.Monty(
+                    self.monty_code,
+                    script_name=f"{self.name}.pym",
+                    type_check=True,
+                    type_check_stubs=self.stubs,
+                    inputs=self._input_names,
+                    external_functions=self._external_names,
+                    dataclass_registry=self.dataclass_registry,
+                )
+            except pydantic_monty.MontyTypingError as e:
+                # Convert type errors to ExecutionError
+                raise ExecutionError(
+                    f"Type checking failed: {str(e)}",
+                    lineno=None,
+                    source_context=None,
+                    suggestion="Fix type errors in your code",
+                ) from e
+            self._monty = monty
 
         # Execute
         start_time = time.time()
@@ -532,13 +567,12 @@ class GrailScript:
             self._handle_run_error(e, start_time, captured_output)
 
         duration_ms = (time.time() - start_time) * 1000
-        stdout_text = "".join(captured_output)
 
         # Write success log
         if self._artifacts:
             self._artifacts.write_run_log(
                 self.name,
-                stdout=stdout_text,
+                stdout="".join(captured_output),
                 stderr="",
                 duration_ms=duration_ms,
                 success=True,
@@ -686,6 +720,7 @@ def load(
         dataclass_registry=dataclass_registry,
     )
     script._parse_result = parse_result  # Cache for check() reuse
+    script._check_result = check_result
     return script
 
 
@@ -716,7 +751,7 @@ async def run(
     input_names = list(inputs.keys()) if inputs else []
     monty = pydantic_monty.Monty(code, inputs=input_names)
 
-    parsed_limits = (limits or Limits.default()).to_monty()
+    parsed_limits = _monty_limits(limits or Limits.default())
 
     os_access = None
     if environ:
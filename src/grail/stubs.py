@@ -1,5 +1,6 @@
 """Type stub generator for Monty's type checker."""
 
+import functools
 import logging
 import re
 
@@ -7,44 +8,53 @@ from grail._types import ExternalSpec, InputSpec
 
 logger = logging.getLogger(__name__)
 
-_TYPING_NAMES: set[str] = {
-    "Any",
-    "Optional",
-    "Union",
-    "List",
-    "Dict",
-    "Set",
-    "Tuple",
-    "Callable",
-    "Awaitable",
-    "Iterator",
-    "Iterable",
-    "Sequence",
-    "MutableSequence",
-    "Mapping",
-    "MutableMapping",
-    "Protocol",
-    "TypeVar",
-    "Literal",
-    "Annotated",
-    "Final",
-    "TypedDict",
-    "NotRequired",
-    "Required",
-    "ClassVar",
-    "Generic",
-    "ParamSpec",
-    "Concatenate",
-    "TypeAlias",
-    "TypeGuard",
-    "Never",
-    "Self",
-}
-
-
-def _collect_typing_imports(type_str: str) -> set[str]:
-    """Return typing names referenced inside the annotation."""
-    return {name for name in _TYPING_NAMES if re.search(rf"\b{name}\b", type_str)}
+_TYPING_NAMES: frozenset[str] = frozenset(
+    {
+        "Any",
+        "Optional",
+        "Union",
+        "List",
+        "Dict",
+        "Set",
+        "Tuple",
+        "Callable",
+        "Awaitable",
+        "Iterator",
+        "Iterable",
+        "Sequence",
+        "MutableSequence",
+        "Mapping",
+        "MutableMapping",
+        "Protocol",
+        "TypeVar",
+        "Literal",
+        "Annotated",
+        "Final",
+        "TypedDict",
+        "NotRequired",
+        "Required",
+        "ClassVar",
+        "Generic",
+        "ParamSpec",
+        "Concatenate",
+        "TypeAlias",
+        "TypeGuard",
+        "Never",
+        "Self",
+    }
+)
+
+_WORD_RE = re.compile(r"\w+")
+
+
+@functools.lru_cache(maxsize=1024)
+def _collect_typing_imports(type_str: str) -> frozenset[str]:
+    """Return typing names referenced inside the annotation.
+
+    Annotation strings repeat heavily across externals and scripts, so
+    results are memoized in a bounded, thread-safe LRU cache.
+    """
+    return _TYPING_NAMES.intersection(_WORD_RE.findall(type_str))
 
 
 def generate_stubs(
@@ -98,10 +108,8 @@ def generate_stubs(
 
         params_str = ", ".join(params)
 
-        if external.is_async:
-            lines.append(f"async def {external.name}({params_str}) -> {external.return_type}:")
-        else:
-            lines.append(f"def {external.name}({params_str}) -> {external.return_type}:")
+        def_keyword = "async def" if external.is_async else "def"
+        lines.append(f"{def_keyword} {external.name}({params_str}) -> {external.return_type}:")
 
         if external.docstring:
             escaped = external.docstring.replace("\\", "\\\\").replace('"""', '\\"\\"\\"')
@@ -5,6 +5,16 @@ from pathlib import Path
 
 FIXTURES_DIR = Path(__file__).parent
 
+INVALID_FIXTURES = ("invalid_class.pym", "invalid_with.pym", "invalid_generator.pym")
+
+EXPECTED_FIXTURES = (
+    "simple.pym",
+    "with_multiple_externals.pym",
+    *INVALID_FIXTURES,
+    "missing_annotation.pym",
+    "non_ellipsis_body.pym",
+)
+
 
 def test_simple_pym_is_valid_python() -> None:
     """simple.pym should be syntactically valid Python."""
@@ -20,23 +30,12 @@ def test_with_multiple_externals_is_valid() -> None:
 
 def test_invalid_fixtures_are_valid_python() -> None:
     """Invalid .pym files should still be valid Python syntax."""
-    for name in ["invalid_class.pym", "invalid_with.pym", "invalid_generator.pym"]:
+    for name in INVALID_FIXTURES:
         content = (FIXTURES_DIR / name).read_text()
         ast.parse(content)
 
 
 def test_all_fixtures_exist() -> None:
     """All expected fixtures should exist."""
-    expected = [
-        "simple.pym",
-        "with_multiple_externals.pym",
-        "invalid_class.pym",
-        "invalid_with.pym",
-        "invalid_generator.pym",
-        "missing_annotation.pym",
-        "non_ellipsis_body.pym",
-    ]
-
-    for name in expected:
-        path = FIXTURES_DIR / name
-        assert path.exists(), f"Missing fixture: {name}"
+    for name in EXPECTED_FIXTURES:
+        assert (FIXTURES_DIR / name).is_file(), f"Missing fixture: {name}"
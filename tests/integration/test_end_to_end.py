@@ -149,13 +149,17 @@ await add_one(x)
     assert check_data["valid"] is True
     assert "errors" in check_data
 
+    externals_data = json.loads((artifacts_dir / "externals.json").read_text())
+    assert [ext["name"] for ext in externals_data["externals"]] == ["add_one"]
+
+    inputs_data = json.loads((artifacts_dir / "inputs.json").read_text())
+    assert [inp["name"] for inp in inputs_data["inputs"]] == ["x"]
+
 
 @pytest.mark.integration
-def test_inline_run():
+async def test_inline_run():
     """Test grail.run() for inline code."""
-    import asyncio
-
-    result = asyncio.run(grail.run("x + y", inputs={"x": 1, "y": 2}))
+    result = await grail.run("x + y", inputs={"x": 1, "y": 2})
     assert result == 3
 
 
@@ -183,10 +187,8 @@ x * 2
 
 
 @pytest.mark.integration
-def test_error_handling():
+async def test_error_handling():
     """Test that errors are properly caught and mapped."""
-    import asyncio
-
     with tempfile.NamedTemporaryFile(mode="w", suffix=".pym", delete=False) as f:
         f.write("""
 from grail import Input
@@ -201,7 +203,7 @@ y = undefined_variable
         script = grail.load(pym_path, grail_dir=None)
 
         with pytest.raises(grail.ExecutionError):
-            asyncio.run(script.run(inputs={"x": 5}))
+            await script.run(inputs={"x": 5})
 
     finally:
         pym_path.unlink()
@@ -245,3 +247,18 @@ async def test_on_event_receives_lifecycle_events():
     event_types = [e.type for e in events]
     assert "run_start" in event_types
     assert "run_complete" in event_types
+
+
+@pytest.mark.integration
+async def test_run_log_records_print_output(tmp_path):
+    """run.log should contain print() output when artifacts are enabled."""
+    pym_path = tmp_path / "printer.pym"
+    pym_path.write_text('print("logged line")\n1\n')
+
+    grail_dir = tmp_path / ".grail"
+    script = grail.load(pym_path, grail_dir=grail_dir)
+
+    assert await script.run() == 1
+
+    run_log = (grail_dir / "printer" / "run.log").read_text()
+    assert "logged line" in run_log
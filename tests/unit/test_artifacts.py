@@ -43,6 +43,7 @@ def test_creates_directory_structure(tmp_path):
     assert (script_dir / "check.json").exists()
     assert (script_dir / "externals.json").exists()
     assert (script_dir / "inputs.json").exists()
+    assert not list(script_dir.glob("*.tmp")), "temporary files should be renamed into place"
 
 
 def test_write_run_log(tmp_path):
@@ -2,7 +2,9 @@
 
 from pathlib import Path
 
-from grail.checker import check_pym
+import pytest
+
+from grail.checker import MontyCompatibilityChecker, check_pym
 from grail.parser import parse_pym_content, parse_pym_file
 
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
@@ -17,32 +19,22 @@ def test_valid_pym_passes() -> None:
     assert len(check_result.errors) == 0
 
 
-def test_class_definition_detected() -> None:
-    """Class definitions should be detected as E001."""
-    result = parse_pym_file(FIXTURES_DIR / "invalid_class.pym")
+@pytest.mark.parametrize(
+    ("fixture", "code", "message"),
+    [
+        ("invalid_class.pym", "E001", "Class definitions"),
+        ("invalid_with.pym", "E003", "'with' statements"),
+        ("invalid_generator.pym", "E002", "Generator functions"),
+    ],
+)
+def test_unsupported_feature_detected(fixture: str, code: str, message: str) -> None:
+    """Class definitions, 'with' statements and generators should be detected."""
+    result = parse_pym_file(FIXTURES_DIR / fixture)
     check_result = check_pym(result)
 
     assert check_result.valid is False
-    assert any(error.code == "E001" for error in check_result.errors)
-    assert any("Class definitions" in error.message for error in check_result.errors)
-
-
-def test_with_statement_detected() -> None:
-    """'with' statements should be detected as E003."""
-    result = parse_pym_file(FIXTURES_DIR / "invalid_with.pym")
-    check_result = check_pym(result)
-
-    assert check_result.valid is False
-    assert any(error.code == "E003" for error in check_result.errors)
-
-
-def test_generator_detected() -> None:
-    """Generators should be detected as E002."""
-    result = parse_pym_file(FIXTURES_DIR / "invalid_generator.pym")
-    check_result = check_pym(result)
-
-    assert check_result.valid is False
-    assert any(error.code == "E002" for error in check_result.errors)
+    assert any(error.code == code for error in check_result.errors)
+    assert any(message in error.message for error in check_result.errors)
 
 
 def test_forbidden_import_detected() -> None:
@@ -196,3 +188,32 @@ x + 1
     result = check_pym(parse_result)
     assert any(w.code == "W003" and "y" in w.message for w in result.warnings)
     assert not any(w.code == "W003" and "x" in w.message for w in result.warnings)
+
+
+def test_unused_declaration_warnings_use_checker_names() -> None:
+    """W002/W003 should follow the names the checker pass saw referenced."""
+    content = """from grail import external, Input
+
+x: int = Input("x")
+y: int = Input("y")
+
+@external
+async def fetch(id: int) -> str:
+    ...
+
+data = {"v": x}
+data.get
+"""
+    parse_result = parse_pym_content(content)
+    checker = MontyCompatibilityChecker(parse_result.source_lines)
+    checker.visit(parse_result.ast_module)
+
+    assert {"x", "data", "get"} <= checker.referenced_names
+
+    warnings = check_pym(parse_result).warnings
+    unused_externals = {w.message for w in warnings if w.code == "W002"}
+    unused_inputs = {w.message for w in warnings if w.code == "W003"}
+
+    assert any("'fetch'" in m for m in unused_externals)
+    assert any("'y'" in m for m in unused_inputs)
+    assert not any("'x'" in m for m in unused_inputs)
@@ -2,13 +2,9 @@
 
 import pytest
 from pathlib import Path
-import tempfile
-import os
 import json
-import subprocess
-import sys
 
-from grail.cli import cmd_init, cmd_check, cmd_clean, cmd_run, cmd_watch
+from grail.cli import build_parser, cmd_init, cmd_check, cmd_clean, cmd_run, cmd_watch
 import argparse
 
 
@@ -113,15 +109,12 @@ def test_run_rejects_invalid_input_format(tmp_path, capsys):
     assert "Invalid input format" in captured.err
 
 
-def test_run_input_flag_appears_in_help():
+def test_run_input_flag_appears_in_help(capsys):
     """The --input flag should appear in the grail run help text."""
-    result = subprocess.run(
-        [sys.executable, "-m", "grail", "run", "--help"],
-        capture_output=True,
-        text=True,
-    )
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["run", "--help"])
 
-    assert "--input" in result.stdout
+    assert "--input" in capsys.readouterr().out
 
 
 def test_check_nonexistent_file_shows_friendly_error(capsys):
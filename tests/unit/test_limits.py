@@ -141,6 +141,11 @@ class TestLimitsPresets:
         assert isinstance(Limits.default(), Limits)
         assert isinstance(Limits.permissive(), Limits)
 
+    def test_presets_are_shared_instances(self):
+        assert Limits.strict() is Limits.strict()
+        assert Limits.default() is Limits.default()
+        assert Limits.permissive() is Limits.permissive()
+
 
 # --- Merging ---
 
@@ -1,17 +1,21 @@
 """Test GrailScript class."""
 
-import pytest
 from pathlib import Path
 
-from grail.script import load, GrailScript
-from grail.errors import InputError, ExternalError
+import pytest
+
+pytest.importorskip("pydantic_monty")
+
+from grail.errors import ExternalError, InputError
+from grail.script import GrailScript, load
 
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+SIMPLE_PYM = FIXTURES_DIR / "simple.pym"
 
 
 def test_load_pym_file():
     """Should load and parse .pym file."""
-    script = load(FIXTURES_DIR / "simple.pym", grail_dir=None)
+    script = load(SIMPLE_PYM, grail_dir=None)
 
     assert script.name == "simple"
     assert "double" in script.externals
@@ -22,16 +26,36 @@ def test_load_pym_file():
 
 def test_check_returns_result():
     """Should return CheckResult."""
-    script = load(FIXTURES_DIR / "simple.pym", grail_dir=None)
+    script = load(SIMPLE_PYM, grail_dir=None)
+    result = script.check()
+
+    assert result.valid is True
+    assert result.file == str(SIMPLE_PYM)
+
+
+def test_check_reuses_load_time_checks(monkeypatch):
+    """check() should not re-run check_pym and should not mutate the cached result."""
+    script = load(SIMPLE_PYM, grail_dir=None)
+    cached = script._check_result
+    assert cached is not None
+
+    def fail_check_pym(parse_result):
+        raise AssertionError("check_pym should not run again")
+
+    monkeypatch.setattr("grail.script.check_pym", fail_check_pym)
     result = script.check()
 
+    assert result is not cached
     assert result.valid is True
-    assert result.file == str(FIXTURES_DIR / "simple.pym")
+    assert result.file == str(SIMPLE_PYM)
+    assert result.errors is not cached.errors
+    assert result.warnings is not cached.warnings
+    assert result.info is not cached.info
 
 
 def test_validate_inputs_missing_required():
     """Should raise InputError for missing required input."""
-    script = load(FIXTURES_DIR / "simple.pym", grail_dir=None)
+    script = load(SIMPLE_PYM, grail_dir=None)
 
     with pytest.raises(InputError, match="Missing required input"):
         script._validate_inputs({})
@@ -39,7 +63,7 @@ def test_validate_inputs_missing_required():
 
 def test_validate_inputs_extra_input_warns():
     """Should warn for extra inputs."""
-    script = load(FIXTURES_DIR / "simple.pym", grail_dir=None)
+    script = load(SIMPLE_PYM, grail_dir=None)
 
     with pytest.warns(UserWarning, match="Extra input"):
         script._validate_inputs({"x": 1, "extra": 2}, strict=False)
@@ -47,7 +71,7 @@ def test_validate_inputs_extra_input_warns():
 
 def test_validate_externals_missing():
     """Should raise ExternalError for missing external."""
-    script = load(FIXTURES_DIR / "simple.pym", grail_dir=None)
+    script = load(SIMPLE_PYM, grail_dir=None)
 
     with pytest.raises(ExternalError, match="Missing external function"):
         script._validate_externals({})
@@ -55,7 +79,7 @@ def test_validate_externals_missing():
 
 def test_validate_externals_extra_warns():
     """Should warn for extra externals."""
-    script = load(FIXTURES_DIR / "simple.pym", grail_dir=None)
+    script = load(SIMPLE_PYM, grail_dir=None)
 
     with pytest.warns(UserWarning, match="Extra external"):
         script._validate_externals({"double": lambda x: x * 2, "extra": lambda: None}, strict=False)
@@ -65,9 +89,7 @@ def test_validate_externals_extra_warns():
 @pytest.mark.integration
 async def test_run_simple_script():
     """Should execute simple script."""
-    pytest.importorskip("pydantic_monty")
-
-    script = load(FIXTURES_DIR / "simple.pym", grail_dir=None)
+    script = load(SIMPLE_PYM, grail_dir=None)
 
     async def double_impl(n: int) -> int:
         return n * 2
@@ -80,9 +102,7 @@ async def test_run_simple_script():
 @pytest.mark.integration
 def test_run_sync():
     """Should execute script synchronously."""
-    pytest.importorskip("pydantic_monty")
-
-    script = load(FIXTURES_DIR / "simple.pym", grail_dir=None)
+    script = load(SIMPLE_PYM, grail_dir=None)
 
     async def double_impl(n: int) -> int:
         return n * 2
@@ -92,12 +112,29 @@ def test_run_sync():
     assert result == 10
 
 
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_run_reuses_compiled_monty():
+    """Repeated runs should reuse the type-checked Monty program."""
+    script = load(SIMPLE_PYM, grail_dir=None)
+
+    async def double_impl(n: int) -> int:
+        return n * 2
+
+    assert await script.run(inputs={"x": 5}, externals={"double": double_impl}) == 10
+    monty = script._monty
+    assert monty is not None
+
+    assert await script.run(inputs={"x": 7}, externals={"double": double_impl}) == 14
+    assert script._monty is monty
+
+
 def test_load_with_limits():
     """Should accept Limits parameter."""
     from grail.limits import Limits
 
     script = load(
-        FIXTURES_DIR / "simple.pym",
+        SIMPLE_PYM,
         limits=Limits(max_memory="8mb"),
         grail_dir=None,
     )
@@ -106,16 +143,31 @@ def test_load_with_limits():
     assert script.limits.max_memory == 8 * 1024 * 1024
 
 
+def test_prepare_monty_limits_reuses_converted_dict():
+    """Equal limits should map to one shared Monty limits dict."""
+    from grail.limits import Limits
+
+    script = load(SIMPLE_PYM, limits=Limits(max_memory="8mb"), grail_dir=None)
+
+    first = script._prepare_monty_limits(None)
+    assert first == {"max_memory": 8 * 1024 * 1024}
+    assert script._prepare_monty_limits(None) is first
+    assert script._prepare_monty_limits(Limits(max_recursion=50)) == {
+        "max_memory": 8 * 1024 * 1024,
+        "max_recursion_depth": 50,
+    }
+
+
 def test_load_with_files():
     """Should accept files parameter."""
-    script = load(FIXTURES_DIR / "simple.pym", files={"/data/test.txt": "content"}, grail_dir=None)
+    script = load(SIMPLE_PYM, files={"/data/test.txt": "content"}, grail_dir=None)
 
     assert script.files == {"/data/test.txt": "content"}
 
 
 def test_load_creates_artifacts(tmp_path):
     """Should create artifacts in grail_dir."""
-    script = load(FIXTURES_DIR / "simple.pym", grail_dir=tmp_path / ".grail")
+    script = load(SIMPLE_PYM, grail_dir=tmp_path / ".grail")
 
     artifacts_dir = tmp_path / ".grail" / "simple"
     assert artifacts_dir.exists()
@@ -133,7 +185,7 @@ def test_map_error_to_pym_uses_source_map():
     source_map.add_mapping(pym_line=10, monty_line=3)
 
     script = GrailScript(
-        path=FIXTURES_DIR / "simple.pym",
+        path=SIMPLE_PYM,
         externals={},
         inputs={},
         monty_code="",